@@ -3,8 +3,8 @@ Configuration management using Pydantic settings.
 Environment variables are loaded from .env file or system environment.
 """
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,13 +20,17 @@ class Settings(BaseSettings):
     storage_backend: str = "local"  # Future: s3, minio, gcs
     storage_base_path: str = "UPLOAD_DIR"
     max_file_size: int = 5 * 1024 * 1024 * 1024  # 5GB default
+    etag_algorithm: str = "md5"  # md5 (S3-compatible), md5-multipart, sha256, or blake3 (needs blake3 package)
     
     # Security
+    enable_cors: bool = True  # Disable when clients are same-origin or a proxy handles CORS
     allowed_origins: list[str] = ["*"]
     enable_path_traversal_protection: bool = True
     
     # Performance
-    chunk_size: int = 1024 * 1024  # 1MB chunks for streaming
+    chunk_size: int = 8 * 1024 * 1024  # 8MB chunks for streaming
+    access_log: bool = False  # Per-request access logging; prefer the reverse proxy's log
+    cache_max_age: int = 0  # Cache-Control max-age for downloads; 0 = always revalidate via ETag
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -35,13 +39,23 @@ class Settings(BaseSettings):
         extra="ignore"
     )
     
-    def get_storage_path(self) -> Path:
-        """Get the resolved storage base path."""
+    @cached_property
+    def storage_path(self) -> Path:
+        """Storage root resolved from storage_base_path once, on first access."""
         return Path(self.storage_base_path).resolve()
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Load settings once per process and ensure the storage directory exists.
+    Modules capture the result (and constants derived from it) at import time,
+    so clearing the cache does not reconfigure an already imported app.
+    """
+    settings = Settings()
+    settings.storage_path.mkdir(parents=True, exist_ok=True)
+    return settings
 
-# Ensure storage directory exists
-settings.get_storage_path().mkdir(parents=True, exist_ok=True)
+
+# Global settings instance for module-level consumers (app setup, storage backend)
+settings = get_settings()
@@ -1,7 +1,13 @@
+import asyncio
 from datetime import datetime
-from fastapi import FastAPI, Request, status
+from typing import Optional
+
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.config import settings
 from app.exceptions import (
@@ -14,6 +20,7 @@ from app.exceptions import (
 )
 from app.routers import buckets, objects
 from app.schemas import HealthCheck
+from app.server_utils import FlatAPIRouter
 
 
 # Initialize FastAPI app
@@ -23,126 +30,178 @@ app = FastAPI(
     description="Self-hosted object storage system - AWS S3 alternative with local filesystem backend",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 
-# CORS middleware configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
-    allow_headers=["*"],
+# CORS middleware configuration (skipped entirely when disabled, saving a
+# middleware frame on every request)
+if settings.enable_cors and settings.allowed_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.allowed_origins,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
+        allow_headers=["*"],
+    )
+
+
+# Pre-serialized error body fragments; only the detail string is encoded per error
+def _error_template(error: str, code: str) -> tuple[bytes, bytes]:
+    """Build the static JSON bytes surrounding an error's detail field."""
+    return (
+        b'{"error":' + orjson.dumps(error) + b',"detail":',
+        b',"code":' + orjson.dumps(code) + b'}',
+    )
+
+
+_BUCKET_NOT_FOUND_TMPL = _error_template("BucketNotFound", "NoSuchBucket")
+_BUCKET_ALREADY_EXISTS_TMPL = _error_template("BucketAlreadyExists", "BucketAlreadyOwnedByYou")
+_OBJECT_NOT_FOUND_TMPL = _error_template("ObjectNotFound", "NoSuchKey")
+_STORAGE_ERROR_TMPL = _error_template("StorageError", "InternalError")
+_INVALID_PATH_BODY = orjson.dumps(
+    {"error": "InvalidPath", "detail": "Invalid or unsafe path detected", "code": "InvalidRequest"}
 )
 
 
+def _error_response(status_code: int, template: tuple[bytes, bytes], detail: str) -> Response:
+    """Render an error response by splicing the encoded detail into its template."""
+    prefix, suffix = template
+    return Response(
+        content=prefix + orjson.dumps(detail) + suffix,
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 # Global exception handlers
 @app.exception_handler(BucketNotFoundError)
 async def bucket_not_found_handler(request: Request, exc: BucketNotFoundError):
     """Handle bucket not found exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={"error": "BucketNotFound", "detail": str(exc), "code": "NoSuchBucket"}
-    )
+    return _error_response(status.HTTP_404_NOT_FOUND, _BUCKET_NOT_FOUND_TMPL, str(exc))
 
 
 @app.exception_handler(BucketAlreadyExistsError)
 async def bucket_already_exists_handler(request: Request, exc: BucketAlreadyExistsError):
     """Handle bucket already exists exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_409_CONFLICT,
-        content={"error": "BucketAlreadyExists", "detail": str(exc), "code": "BucketAlreadyOwnedByYou"}
-    )
+    return _error_response(status.HTTP_409_CONFLICT, _BUCKET_ALREADY_EXISTS_TMPL, str(exc))
 
 
 @app.exception_handler(ObjectNotFoundError)
 async def object_not_found_handler(request: Request, exc: ObjectNotFoundError):
     """Handle object not found exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_404_NOT_FOUND,
-        content={"error": "ObjectNotFound", "detail": str(exc), "code": "NoSuchKey"}
-    )
+    return _error_response(status.HTTP_404_NOT_FOUND, _OBJECT_NOT_FOUND_TMPL, str(exc))
 
 
 @app.exception_handler(InvalidPathError)
 async def invalid_path_handler(request: Request, exc: InvalidPathError):
     """Handle invalid path exceptions (path traversal attempts)."""
-    return JSONResponse(
+    return Response(
+        content=_INVALID_PATH_BODY,
         status_code=status.HTTP_400_BAD_REQUEST,
-        content={"error": "InvalidPath", "detail": "Invalid or unsafe path detected", "code": "InvalidRequest"}
+        media_type="application/json",
     )
 
 
 @app.exception_handler(FileSizeLimitExceededError)
 async def file_size_limit_handler(request: Request, exc: FileSizeLimitExceededError):
     """Handle file size limit exceeded exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-        content={
+    return Response(
+        content=orjson.dumps({
             "error": "EntityTooLarge",
             "detail": str(exc),
             "code": "EntityTooLarge",
             "max_size": exc.max_size
-        }
+        }),
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        media_type="application/json",
+    )
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Render HTTP exceptions raised by routers with orjson instead of json.dumps."""
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=headers
     )
 
 
 @app.exception_handler(StorageException)
 async def storage_exception_handler(request: Request, exc: StorageException):
     """Handle generic storage exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"error": "StorageError", "detail": str(exc), "code": "InternalError"}
-    )
+    return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, _STORAGE_ERROR_TMPL, str(exc))
+
+
+# Include routers (flattened to avoid re-creating every route on include)
+FlatAPIRouter(buckets.router, objects.router).include_into(app, prefix="/api/v1")
 
 
-# Include routers
-app.include_router(buckets.router, prefix="/api/v1")
-app.include_router(objects.router, prefix="/api/v1")
+# Health payload: static fields are serialized once, the timestamp is
+# refreshed once per second by a background task instead of per request
+_HEALTH_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "version": settings.app_version,
+    "storage_backend": settings.storage_backend,
+})[:-1] + b',"timestamp":'
+_health_timestamp: bytes = orjson.dumps(datetime.now().replace(microsecond=0))
+_health_refresh_task: Optional[asyncio.Task] = None
+
+
+async def _refresh_health_timestamp():
+    """Update the cached health check timestamp every second."""
+    global _health_timestamp
+    while True:
+        _health_timestamp = orjson.dumps(datetime.now().replace(microsecond=0))
+        await asyncio.sleep(1)
+
+
+def _health_response() -> Response:
+    """Assemble the health check response from the cached payload."""
+    return Response(
+        content=_HEALTH_PREFIX + _health_timestamp + b"}",
+        media_type="application/json",
+    )
 
 
 # Root endpoints
 @app.get(
     "/",
-    response_model=HealthCheck,
+    responses={200: {"model": HealthCheck}},
     tags=["Health"],
     summary="Health check",
     description="Returns service health status and configuration information."
 )
 async def root():
     """Root endpoint with health check."""
-    return HealthCheck(
-        status="healthy",
-        version=settings.app_version,
-        storage_backend=settings.storage_backend,
-        timestamp=datetime.now()
-    )
+    return _health_response()
 
 
 @app.get(
     "/health",
-    response_model=HealthCheck,
+    responses={200: {"model": HealthCheck}},
     tags=["Health"],
     summary="Health check",
     description="Health check endpoint for monitoring and load balancers."
 )
 async def health_check():
     """Health check endpoint."""
-    return HealthCheck(
-        status="healthy",
-        version=settings.app_version,
-        storage_backend=settings.storage_backend,
-        timestamp=datetime.now()
-    )
+    return _health_response()
 
 
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Initialize resources on startup."""
+    global _health_refresh_task
+    _health_refresh_task = asyncio.create_task(_refresh_health_timestamp())
     print(f"🚀 {settings.app_name} v{settings.app_version} starting...")
     print(f"📦 Storage backend: {settings.storage_backend}")
-    print(f"📁 Storage path: {settings.get_storage_path()}")
+    print(f"📁 Storage path: {settings.storage_path}")
     print(f"🔒 Path traversal protection: {settings.enable_path_traversal_protection}")
     print(f"📏 Max file size: {settings.max_file_size / (1024*1024*1024):.2f} GB")
 
@@ -150,6 +209,8 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup resources on shutdown."""
+    if _health_refresh_task is not None:
+        _health_refresh_task.cancel()
     print(f"👋 {settings.app_name} shutting down...")
 
 
@@ -159,7 +220,7 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=8001,
-        log_level="info",
-        access_log=True
+        log_level="warning",
+        access_log=settings.access_log
     )
 
@@ -0,0 +1,40 @@
+"""
+Path helpers for mapping bucket names and object keys onto the storage root.
+"""
+import os
+import re
+
+from app.exceptions import InvalidPathError
+
+
+# Parent-directory segments, backslashes and NUL bytes are never allowed in a
+# relative storage path; matching them lexically avoids a realpath() syscall.
+_UNSAFE_PATH_RE = re.compile(r"(?:^|/)\.\.(?:/|$)|[\\\x00]")
+
+
+def safe_join(root: str, relative: str) -> str:
+    """
+    Join a relative bucket/key path onto root.
+    Raises InvalidPathError if the path is absolute or could escape root.
+    """
+    if not relative or relative[0] == "/" or _UNSAFE_PATH_RE.search(relative):
+        raise InvalidPathError(relative)
+    joined = root + os.sep + relative
+    # Defense in depth: the normalized path must still live under root
+    if not os.path.normpath(joined).startswith(root + os.sep):
+        raise InvalidPathError(relative)
+    return joined
+
+
+def has_symlink(root: str, path: str) -> bool:
+    """
+    Return True if path, or any directory between it and root, is a symbolic link.
+    A lexically safe path can still escape root through a link, so callers
+    reject these instead of resolving them. Costs one lstat per component.
+    """
+    prefix_len = len(root)
+    while len(path) > prefix_len:
+        if os.path.islink(path):
+            return True
+        path = os.path.dirname(path)
+    return False
@@ -1,8 +1,8 @@
 """
 Bucket management API routes.
 """
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.exceptions import (
     BucketAlreadyExistsError,
@@ -18,8 +18,9 @@ router = APIRouter(prefix="/buckets", tags=["Buckets"])
 
 @router.post(
     "/",
-    response_model=BucketResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": BucketResponse}},
     summary="Create a new bucket",
     description="Creates a new storage bucket. Bucket names must be unique and follow naming conventions."
 )
@@ -27,60 +28,43 @@ async def create_bucket(bucket: BucketCreate):
     """Create a new storage bucket."""
     try:
         await storage_backend.create_bucket(bucket.name)
-        # Get bucket info
-        buckets = await storage_backend.list_buckets()
-        bucket_info = next((b for b in buckets if b["name"] == bucket.name), None)
-        if bucket_info:
-            return BucketResponse(**bucket_info)
-        # Fallback if not found in list
-        return BucketResponse(
-            name=bucket.name,
-            created_at=bucket_info["created_at"] if bucket_info else None,
-            object_count=0,
-            total_size=0
-        )
+        bucket_info = await storage_backend.get_bucket_info(bucket.name)
+        return ORJSONResponse(status_code=status.HTTP_201_CREATED, content=bucket_info)
     except BucketAlreadyExistsError as e:
         raise bucket_already_exists_http(e.bucket)
 
 
 @router.get(
     "/",
-    response_model=BucketList,
+    responses={200: {"model": BucketList}},
     summary="List all buckets",
     description="Returns a list of all storage buckets with their metadata."
 )
 async def list_buckets():
     """List all storage buckets."""
     buckets = await storage_backend.list_buckets()
-    return BucketList(
-        buckets=[BucketResponse(**b) for b in buckets],
-        total=len(buckets)
-    )
+    # Backend dicts already match BucketResponse; serialize them directly
+    return ORJSONResponse(content={"buckets": buckets, "total": len(buckets)})
 
 
 @router.get(
     "/{bucket_name}",
-    response_model=BucketResponse,
+    responses={200: {"model": BucketResponse}},
     summary="Get bucket information",
     description="Retrieve metadata and statistics for a specific bucket."
 )
 async def get_bucket(bucket_name: str):
     """Get information about a specific bucket."""
-    if not await storage_backend.bucket_exists(bucket_name):
-        raise bucket_not_found_http(bucket_name)
-    
-    buckets = await storage_backend.list_buckets()
-    bucket_info = next((b for b in buckets if b["name"] == bucket_name), None)
-    
-    if not bucket_info:
+    bucket_info = await storage_backend.get_bucket_info(bucket_name)
+    if bucket_info is None:
         raise bucket_not_found_http(bucket_name)
-    
-    return BucketResponse(**bucket_info)
+    return ORJSONResponse(content=bucket_info)
 
 
 @router.delete(
     "/{bucket_name}",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
     summary="Delete a bucket",
     description="Delete an empty bucket. Bucket must not contain any objects."
 )
@@ -88,15 +72,12 @@ async def delete_bucket(bucket_name: str):
     """Delete a bucket (must be empty)."""
     try:
         await storage_backend.delete_bucket(bucket_name)
-        return JSONResponse(
-            status_code=status.HTTP_204_NO_CONTENT,
-            content=None
-        )
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except BucketNotFoundError as e:
         raise bucket_not_found_http(e.bucket)
     except ValueError as e:
         # Bucket not empty
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_409_CONFLICT,
             content={"detail": str(e)}
         )
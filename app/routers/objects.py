@@ -1,10 +1,12 @@
 """
 Object storage API routes.
 """
+from datetime import timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
 
-from fastapi import APIRouter, File, Form, UploadFile, status, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, File, Form, Request, UploadFile, status, Query
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 
 from app.exceptions import (
     BucketNotFoundError,
@@ -14,19 +16,62 @@ from app.exceptions import (
     object_not_found_http,
     file_too_large_http,
 )
-from app.schemas import ObjectList, ObjectListItem, ObjectMetadata, ObjectUploadResponse
-from app.storage import storage_backend
 from app.config import settings
-import aiofiles
+from app.schemas import ObjectList, ObjectMetadata, ObjectUploadResponse
+from app.storage import storage_backend
 
 
 router = APIRouter(prefix="/objects", tags=["Objects"])
 
+_CACHE_CONTROL = f"public, max-age={settings.cache_max_age}"
+# Full downloads at least this large are streamed with prefetched
+# settings.chunk_size reads when the server can't pathsend; below it
+# FileResponse's 64 KiB reads are just as fast
+_STREAM_DOWNLOAD_MIN = 1024 * 1024
+
+
+def _object_headers(metadata: ObjectMetadata) -> dict[str, str]:
+    """Build the validator, caching and checksum headers for an object."""
+    headers = {
+        "ETag": metadata.etag,
+        "Last-Modified": metadata.last_modified_http,
+        "Cache-Control": _CACHE_CONTROL,
+    }
+    if metadata.checksum_crc32 is not None:
+        headers["x-amz-checksum-crc32"] = metadata.checksum_crc32
+    return headers
+
+
+def _is_not_modified(request: Request, metadata: ObjectMetadata) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the object's metadata.
+    If-None-Match takes precedence when both are present (RFC 9110).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        etags = {tag.strip().removeprefix("W/").strip('"') for tag in if_none_match.split(",")}
+        return metadata.etag in etags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # Compare at the one-second resolution of the Last-Modified header we send
+        return int(metadata.last_modified.timestamp()) <= since.timestamp()
+    return False
+
 
 @router.post(
     "/{bucket_name}",
-    response_model=ObjectUploadResponse,
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": ObjectUploadResponse}},
     summary="Upload an object",
     description="Upload a file to the specified bucket. The file is streamed to avoid memory issues."
 )
@@ -44,7 +89,10 @@ async def upload_object(
         # Use filename as key if not provided
         object_key = key if key else file.filename
         if not object_key:
-            return {"error": "Either 'key' or filename must be provided"}
+            return ORJSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"error": "Either 'key' or filename must be provided"}
+            )
         
         metadata = await storage_backend.put_object(
             bucket=bucket_name,
@@ -53,13 +101,16 @@ async def upload_object(
             content_type=content_type
         )
         
-        return ObjectUploadResponse(
-            key=metadata.key,
-            bucket=metadata.bucket,
-            size=metadata.size,
-            etag=metadata.etag,
-            content_type=metadata.content_type,
-            uploaded_at=metadata.last_modified
+        return ORJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content={
+                "key": metadata.key,
+                "bucket": metadata.bucket,
+                "size": metadata.size,
+                "etag": metadata.etag,
+                "content_type": metadata.content_type,
+                "uploaded_at": metadata.last_modified,
+            }
         )
     
     except BucketNotFoundError as e:
@@ -70,7 +121,7 @@ async def upload_object(
 
 @router.get(
     "/{bucket_name}",
-    response_model=ObjectList,
+    responses={200: {"model": ObjectList}},
     summary="List objects in bucket",
     description="List all objects in a bucket with optional prefix filtering."
 )
@@ -81,21 +132,22 @@ async def list_objects(
     """List objects in a bucket."""
     try:
         objects = await storage_backend.list_objects(bucket_name, prefix=prefix)
-        return ObjectList(
-            bucket=bucket_name,
-            objects=[
-                ObjectListItem(
-                    key=obj.key,
-                    size=obj.size,
-                    last_modified=obj.last_modified,
-                    etag=obj.etag,
-                    content_type=obj.content_type
-                )
+        # Build the response dicts directly; no pydantic validation/encoding pass
+        return ORJSONResponse(content={
+            "bucket": bucket_name,
+            "objects": [
+                {
+                    "key": obj.key,
+                    "size": obj.size,
+                    "last_modified": obj.last_modified,
+                    "etag": obj.etag,
+                    "content_type": obj.content_type,
+                }
                 for obj in objects
             ],
-            total=len(objects),
-            prefix=prefix
-        )
+            "total": len(objects),
+            "prefix": prefix,
+        })
     except BucketNotFoundError as e:
         raise bucket_not_found_http(e.bucket)
 
@@ -108,35 +160,48 @@ async def list_objects(
         200: {
             "description": "File content",
             "content": {"application/octet-stream": {}},
-        }
+        },
+        304: {"description": "Not modified"},
     }
 )
-async def download_object(bucket_name: str, key: str):
+async def download_object(request: Request, bucket_name: str, key: str):
     """
     Download an object from a bucket.
-    Uses streaming response to handle large files efficiently.
+    Uses FileResponse (zero-copy pathsend, byte ranges) by default; large full
+    downloads on servers without pathsend stream prefetched chunks instead.
     """
     try:
         object_path, metadata = await storage_backend.get_object(bucket_name, key)
         
-        # Stream the file
-        async def file_stream():
-            async with aiofiles.open(object_path, "rb") as f:
-                while chunk := await f.read(settings.chunk_size):
-                    yield chunk
+        headers = _object_headers(metadata)
+        if _is_not_modified(request, metadata):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         
         # Get filename from key (last part of path)
         filename = key.split("/")[-1]
         
+        if (
+            metadata.size < _STREAM_DOWNLOAD_MIN
+            or "range" in request.headers
+            or "http.response.pathsend" in request.scope.get("extensions", {})
+        ):
+            return FileResponse(
+                path=object_path,
+                media_type=metadata.content_type,
+                filename=filename,
+                headers=headers
+            )
+        
+        # No zero-copy path: FileResponse would read 64 KiB at a time, which is
+        # about 3x slower for large files under plain uvicorn, so stream
+        # settings.chunk_size reads with the next chunk prefetched instead
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        headers["Content-Length"] = str(metadata.size)
+        headers["Accept-Ranges"] = "bytes"
         return StreamingResponse(
-            file_stream(),
+            storage_backend.open_stream(object_path, settings.chunk_size),
             media_type=metadata.content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(metadata.size),
-                "ETag": metadata.etag,
-                "Last-Modified": metadata.last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
-            }
+            headers=headers
         )
     
     except BucketNotFoundError as e:
@@ -149,18 +214,19 @@ async def download_object(bucket_name: str, key: str):
     "/{bucket_name}/{key:path}",
     summary="Get object metadata",
     description="Retrieve object metadata without downloading the file.",
-    status_code=status.HTTP_200_OK
+    status_code=status.HTTP_200_OK,
+    responses={304: {"description": "Not modified"}}
 )
-async def head_object(bucket_name: str, key: str):
+async def head_object(request: Request, bucket_name: str, key: str):
     """Get object metadata (HEAD request)."""
     try:
         metadata = await storage_backend.get_object_metadata(bucket_name, key)
-        return {
-            "Content-Type": metadata.content_type,
-            "Content-Length": str(metadata.size),
-            "ETag": metadata.etag,
-            "Last-Modified": metadata.last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
-        }
+        headers = _object_headers(metadata)
+        if _is_not_modified(request, metadata):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        headers["Content-Length"] = str(metadata.size)
+        return Response(media_type=metadata.content_type, headers=headers)
     except BucketNotFoundError as e:
         raise bucket_not_found_http(e.bucket)
     except ObjectNotFoundError as e:
@@ -170,6 +236,7 @@ async def head_object(bucket_name: str, key: str):
 @router.delete(
     "/{bucket_name}/{key:path}",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
     summary="Delete an object",
     description="Delete an object from the bucket."
 )
@@ -177,7 +244,7 @@ async def delete_object(bucket_name: str, key: str):
     """Delete an object from a bucket."""
     try:
         await storage_backend.delete_object(bucket_name, key)
-        return None
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     except BucketNotFoundError as e:
         raise bucket_not_found_http(e.bucket)
     except ObjectNotFoundError as e:
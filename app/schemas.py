@@ -1,9 +1,14 @@
 """
 Pydantic schemas for request/response validation and API contracts.
 """
+import re
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+
+
+# Lowercase alphanumerics, hyphens and underscores; must start with an alphanumeric
+_BUCKET_NAME_RE = re.compile(r"[a-z0-9][a-z0-9_-]{2,62}")
 
 
 # Bucket Schemas
@@ -11,14 +16,17 @@ class BucketCreate(BaseModel):
     """Request schema for creating a bucket."""
     name: str = Field(..., min_length=3, max_length=63, description="Bucket name (3-63 characters)")
     
-    @validator("name")
-    def validate_bucket_name(cls, v):
+    @field_validator("name")
+    @classmethod
+    def validate_bucket_name(cls, v: str) -> str:
         """Validate bucket name follows S3-like naming conventions."""
-        if not v.replace("-", "").replace("_", "").isalnum():
-            raise ValueError("Bucket name must contain only alphanumeric characters, hyphens, and underscores")
-        if v.startswith("-") or v.startswith("_"):
-            raise ValueError("Bucket name cannot start with hyphen or underscore")
-        return v.lower()
+        v = v.lower()
+        if not _BUCKET_NAME_RE.fullmatch(v):
+            raise ValueError(
+                "Bucket name must contain only alphanumeric characters, hyphens, and underscores, "
+                "and cannot start with hyphen or underscore"
+            )
+        return v
 
 
 class BucketResponse(BaseModel):
@@ -42,8 +50,10 @@ class ObjectMetadata(BaseModel):
     bucket: str = Field(..., description="Bucket name")
     size: int = Field(..., description="Size in bytes")
     content_type: str = Field(..., description="MIME content type")
-    etag: str = Field(..., description="MD5 checksum/ETag")
+    etag: str = Field(..., description="Content checksum/ETag (MD5 by default)")
     last_modified: datetime = Field(..., description="Last modification timestamp")
+    last_modified_http: Optional[str] = Field(None, description="Last modification as an HTTP date")
+    checksum_crc32: Optional[str] = Field(None, description="Base64 CRC32 recorded at upload time")
     storage_path: Optional[str] = Field(None, description="Internal storage path")
 
 
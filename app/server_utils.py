@@ -0,0 +1,59 @@
+"""
+Server utilities for assembling the FastAPI application.
+"""
+import copy
+
+from fastapi import APIRouter, FastAPI
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute, request_response
+from fastapi.utils import get_value_or_default
+from starlette.routing import compile_path
+
+
+class FlatAPIRouter:
+    """
+    Lightweight container for routers that should be mounted under a common prefix.
+
+    FastAPI's ``include_router`` rebuilds every ``APIRoute`` it copies, recomputing
+    the dependant, body field and response fields. ``FlatAPIRouter`` instead walks
+    its child routers once and re-prefixes the already-built routes in place of a copy,
+    so each route is only constructed when it is first declared.
+    """
+
+    def __init__(self, *routers: APIRouter):
+        self.routers = routers
+
+    def include_into(self, app: FastAPI, prefix: str = "") -> None:
+        """Append all child routes to ``app`` with ``prefix`` prepended to their paths."""
+        for router in self.routers:
+            for route in router.routes:
+                app.router.routes.append(_prefix_route(route, prefix, router, app))
+
+
+def _prefix_route(route, prefix: str, router: APIRouter, app: FastAPI):
+    """
+    Return a shallow copy of ``route`` mounted under ``prefix`` and bound to ``app``
+    the way ``include_router`` would: the app's default response class and
+    dependency overrides apply to it.
+    """
+    route = copy.copy(route)
+    if prefix:
+        route.path = prefix + route.path
+        route.path_regex, route.path_format, route.param_convertors = compile_path(route.path)
+    if isinstance(route, APIRoute):
+        if prefix:
+            # Keep OpenAPI operation IDs identical to a regular include_router
+            generate_unique_id = route.generate_unique_id_function
+            if isinstance(generate_unique_id, DefaultPlaceholder):
+                generate_unique_id = generate_unique_id.value
+            route.unique_id = route.operation_id or generate_unique_id(route)
+        route.response_class = get_value_or_default(
+            route.response_class,
+            router.default_response_class,
+            app.router.default_response_class,
+        )
+        route.dependency_overrides_provider = app
+        # The request handler captured both values when the route was built
+        route.app = request_response(route.get_route_handler())
+    return route
+
@@ -2,13 +2,25 @@
 Storage abstraction layer with async operations, streaming, and security.
 Implements local filesystem backend with extensibility for future backends (S3, MinIO, GCS).
 """
+import asyncio
+import base64
+import functools
 import hashlib
 import mimetypes
+import mmap
 import os
+import queue
+import re
+import stat
+import sys
+import tempfile
+import zlib
 from abc import ABC, abstractmethod
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Iterator, Optional
 
 import aiofiles
 from fastapi import UploadFile
@@ -21,8 +33,399 @@ from app.exceptions import (
     ObjectNotFoundError,
     FileSizeLimitExceededError,
 )
+from app.paths import has_symlink, safe_join
 from app.schemas import ObjectMetadata
 
+# Single-pass validators for bucket names and object keys
+_BUCKET_NAME_RE = re.compile(r"\A[A-Za-z0-9_-]{1,63}\Z")
+_UNSAFE_KEY_RE = re.compile(r"\.\.|[\x00-\x1f]")
+
+# Resolved once at import; settings are fixed for the lifetime of the process
+_PATH_TRAVERSAL_PROTECTION = settings.enable_path_traversal_protection
+
+# Linux supports sendfile(2) between regular files, letting uploads spooled
+# to disk be copied into the bucket without passing through user space.
+_FILE_SENDFILE_SUPPORTED = sys.platform.startswith("linux")
+_SENDFILE_CHUNK = 4 * 1024 * 1024
+# Files up to this size are hashed from a single memory map; larger ones are
+# read in chunks to avoid mapping arbitrarily large files into the address space
+_MMAP_HASH_MAX = 256 * 1024 * 1024
+# Maximum number of files hashed in parallel when listing
+_HASH_CONCURRENCY = 10
+# Chunks at least this large are hashed in a worker thread while being written
+_PARALLEL_HASH_MIN = 256 * 1024
+# Bulk object I/O is hinted as sequential and dropped from the page cache once
+# done, so large transfers don't evict the pages LIST/HEAD metadata lookups use.
+# Smaller objects skip the flush and stay cached
+_FADVISE_SUPPORTED = hasattr(os, "posix_fadvise")
+_DROP_CACHE_MIN = 8 * 1024 * 1024
+# Reusable copy buffers for streaming disk-spooled uploads and chunked hashing.
+# Their size is fixed rather than tied to the download chunk_size, so the pool
+# holds at most _CHUNK_POOL_MAX * _COPY_BUFFER_SIZE bytes
+_COPY_BUFFER_SIZE = 1024 * 1024
+_CHUNK_POOL_MAX = 16
+_CHUNK_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue(maxsize=_CHUNK_POOL_MAX)
+
+
+def _acquire_buffer() -> bytearray:
+    """Take a copy buffer from the pool, allocating one if it is empty."""
+    try:
+        return _CHUNK_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray(_COPY_BUFFER_SIZE)
+
+
+def _release_buffer(buf: bytearray) -> None:
+    """Return a buffer to the pool; surplus buffers are left to the GC."""
+    try:
+        _CHUNK_POOL.put_nowait(buf)
+    except queue.Full:
+        pass
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint that fd will be read or written sequentially."""
+    if _FADVISE_SUPPORTED:
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _drop_cache(fd: int, sync: bool = False) -> None:
+    """
+    Evict fd's pages from the page cache. Blocking. Dirty pages cannot be
+    dropped, so written files are flushed with fdatasync first (sync=True).
+    """
+    if not _FADVISE_SUPPORTED:
+        return
+    try:
+        if sync:
+            os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+# Part size of "md5-multipart" ETags, and the pool hashing those parts in parallel.
+# Kept apart from _HASH_POOL, whose workers wait on it while hashing whole files
+_MULTIPART_PART_SIZE = 16 * 1024 * 1024
+_PART_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="etag-part")
+
+
+def _md5_digest(data) -> bytes:
+    """Return the raw MD5 digest of a buffer."""
+    return hashlib.md5(data).digest()
+
+
+class _MultipartMD5:
+    """
+    S3 multipart-style ETag: the MD5 of the concatenated MD5 digests of
+    fixed-size parts, suffixed with the part count ("<hex>-N"). Streams are
+    hashed part by part; files on disk have all parts hashed in parallel.
+    """
+    
+    def __init__(self, part_size: int = _MULTIPART_PART_SIZE):
+        self._part_size = part_size
+        self._part = hashlib.md5()
+        self._part_len = 0
+        self._digests: list[bytes] = []
+    
+    def update(self, data) -> None:
+        """Feed the next bytes of the stream, closing each part as it fills."""
+        view = memoryview(data)
+        while view:
+            take = min(len(view), self._part_size - self._part_len)
+            self._part.update(view[:take])
+            self._part_len += take
+            view = view[take:]
+            if self._part_len == self._part_size:
+                self._digests.append(self._part.digest())
+                self._part = hashlib.md5()
+                self._part_len = 0
+    
+    def update_mmap(self, path) -> None:
+        """
+        Hash a whole file. Files up to _MMAP_HASH_MAX have their parts hashed
+        concurrently from a memory map; larger ones are read part by part.
+        """
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return
+            if size > _MMAP_HASH_MAX:
+                for data in _iter_file_buffers(f, size):
+                    self.update(data)
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                parts = [view[o:o + self._part_size] for o in range(0, size, self._part_size)]
+                try:
+                    self._digests.extend(_PART_HASH_POOL.map(_md5_digest, parts))
+                finally:
+                    # The map can't be closed while slices of it are still exported
+                    for part in parts:
+                        part.release()
+    
+    def hexdigest(self) -> str:
+        """Combine the part digests into the "<hex>-N" ETag."""
+        digests = self._digests
+        if self._part_len or not digests:
+            digests = digests + [self._part.digest()]
+        return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def _resolve_hasher_factory(algorithm: str):
+    """Return a zero-argument constructor for the configured ETag hash algorithm."""
+    algorithm = algorithm.lower()
+    if algorithm == "md5-multipart":
+        return _MultipartMD5
+    if algorithm == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError as e:
+            raise RuntimeError("etag_algorithm 'blake3' requires the 'blake3' package") from e
+        # Let BLAKE3 spread large inputs across all cores
+        return functools.partial(blake3, max_threads=blake3.AUTO)
+    # Validate the algorithm eagerly so misconfiguration fails at startup;
+    # variable-length digests (shake_*) need a length and can't be ETags
+    try:
+        hashlib.new(algorithm).hexdigest()
+    except TypeError as e:
+        raise ValueError(f"etag_algorithm '{algorithm}' has no fixed-length digest") from e
+    return getattr(hashlib, algorithm, None) or functools.partial(hashlib.new, algorithm)
+
+
+_new_hasher = _resolve_hasher_factory(settings.etag_algorithm)
+
+
+def _iter_file_buffers(f, size: int) -> Iterator:
+    """
+    Yield the content of an open binary file as buffers valid only until the next
+    iteration: one memory map for files up to _MMAP_HASH_MAX, pooled chunks otherwise.
+    """
+    if 0 < size <= _MMAP_HASH_MAX:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+        return
+    buf = _acquire_buffer()
+    view = memoryview(buf)
+    try:
+        while n := f.readinto(buf):
+            with view[:n] as chunk:
+                yield chunk
+    finally:
+        view.release()
+        _release_buffer(buf)
+
+
+def _digest_file(path: Path, with_crc32: bool = False) -> tuple[str, Optional[int]]:
+    """
+    Compute the ETag, and optionally the CRC32, of a file on disk in one read.
+    Blocking; run it in a worker thread. Hashers with update_mmap (BLAKE3,
+    multipart MD5) hash the file themselves in parallel.
+    """
+    hasher = _new_hasher()
+    hash_mmap = hasattr(hasher, "update_mmap")
+    crc32 = 0 if with_crc32 else None
+    
+    with open(path, "rb") as f:
+        fd = f.fileno()
+        size = os.fstat(fd).st_size
+        _advise_sequential(fd)
+        if with_crc32 or not hash_mmap:
+            for data in _iter_file_buffers(f, size):
+                if not hash_mmap:
+                    hasher.update(data)
+                if with_crc32:
+                    crc32 = zlib.crc32(data, crc32)
+        if hash_mmap and size:
+            hasher.update_mmap(path)
+        if size >= _DROP_CACHE_MIN:
+            _drop_cache(fd)
+    return hasher.hexdigest(), crc32
+
+
+def _hash_file(path: Path) -> str:
+    """Compute the ETag of a file on disk. Blocking; run it in a worker thread."""
+    return _digest_file(path)[0]
+
+
+# Extended attributes caching per-object metadata computed at upload time.
+# The ETag attribute is namespaced by algorithm and stamped with the size and
+# mtime it was computed for, so a changed file or algorithm is never served stale.
+_XATTR_SUPPORTED = hasattr(os, "setxattr")
+_ETAG_XATTR = f"user.etag.{settings.etag_algorithm.lower()}"
+_CONTENT_TYPE_XATTR = "user.content_type"
+# CRC32 recorded at upload time. Unlike the ETag digest it is linear, so a range
+# rewrite can update it from the old and new bytes alone (crc32_combine-style)
+_CHECKSUM_XATTR = "user.checksum.crc32"
+
+
+def _store_cached_metadata(
+    path: Path,
+    st: os.stat_result,
+    etag: str,
+    content_type: Optional[str] = None,
+    crc32: Optional[int] = None,
+) -> None:
+    """Persist the ETag (and optionally content type and CRC32) as xattrs; no-op where unsupported."""
+    if not _XATTR_SUPPORTED:
+        return
+    stamp = f"{st.st_size}:{st.st_mtime_ns}"
+    try:
+        os.setxattr(path, _ETAG_XATTR, f"{stamp}:{etag}".encode())
+        if content_type is not None:
+            os.setxattr(path, _CONTENT_TYPE_XATTR, content_type.encode())
+        if crc32 is not None:
+            os.setxattr(path, _CHECKSUM_XATTR, f"{stamp}:{crc32}".encode())
+    except OSError:
+        pass  # Filesystem without user xattrs; ETags will be recomputed on demand
+
+
+def _load_stamped_xattr(path: Path, name: str, st: os.stat_result) -> Optional[str]:
+    """Return a size/mtime-stamped xattr value if it still matches the file."""
+    if not _XATTR_SUPPORTED:
+        return None
+    try:
+        size, mtime_ns, value = os.getxattr(path, name).decode().split(":", 2)
+    except (OSError, ValueError):
+        return None
+    if int(size) != st.st_size or int(mtime_ns) != st.st_mtime_ns:
+        return None
+    return value
+
+
+def _load_cached_etag(path: Path, st: os.stat_result) -> Optional[str]:
+    """Return the xattr-cached ETag if it still matches the file's size and mtime."""
+    return _load_stamped_xattr(path, _ETAG_XATTR, st)
+
+
+def _load_cached_checksum(path: Path, st: os.stat_result) -> Optional[str]:
+    """Return the upload-time CRC32, base64 encoded as in x-amz-checksum-crc32."""
+    crc32 = _load_stamped_xattr(path, _CHECKSUM_XATTR, st)
+    if crc32 is None:
+        return None
+    return _encode_crc32(int(crc32))
+
+
+def _encode_crc32(crc32: int) -> str:
+    """Encode a CRC32 value the way S3 checksum headers do (big-endian, base64)."""
+    return base64.b64encode(crc32.to_bytes(4, "big")).decode()
+
+
+def _load_cached_content_type(path: Path) -> Optional[str]:
+    """Return the content type recorded at upload time, if any."""
+    if not _XATTR_SUPPORTED:
+        return None
+    try:
+        return os.getxattr(path, _CONTENT_TYPE_XATTR).decode()
+    except OSError:
+        return None
+
+
+# Bounded worker pool for hashing files that miss the xattr ETag cache; its size
+# caps how many files are read concurrently, however many are queued
+_HASH_POOL = ThreadPoolExecutor(
+    max_workers=min(_HASH_CONCURRENCY, os.cpu_count() or 1),
+    thread_name_prefix="etag-hash",
+)
+
+
+async def _get_etag(path: Path, st: os.stat_result) -> str:
+    """Get a file's ETag from the xattr cache, hashing (and caching) it on a miss."""
+    etag = _load_cached_etag(path, st)
+    if etag is None:
+        etag = await _compute_etag(path, st)
+    return etag
+
+
+async def _compute_etag(path: Path, st: os.stat_result) -> str:
+    """Hash a file on the bounded pool and cache the resulting ETag."""
+    loop = asyncio.get_running_loop()
+    etag = await loop.run_in_executor(_HASH_POOL, _hash_file, path)
+    _store_cached_metadata(path, st, etag)
+    return etag
+
+
+def _walk_stats(path: str) -> tuple[int, int]:
+    """Count the files under path and sum their sizes in a single scandir pass."""
+    count = size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                count += 1
+                size += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                sub_count, sub_size = _walk_stats(entry.path)
+                count += sub_count
+                size += sub_size
+    return count, size
+
+
+def _walk_files(path: str, name_prefix: str = "", key_prefix: str = ""):
+    """
+    Recursively yield (key, DirEntry) pairs for the regular files under path.
+    Symbolic links are skipped, matching object lookups, which reject them.
+    Keys are built from entry names joined with "/" (whatever os.sep is) under
+    key_prefix. Only top-level entries whose name starts with name_prefix are visited.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if name_prefix and not entry.name.startswith(name_prefix):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, key_prefix=key_prefix + entry.name + "/")
+            elif entry.is_file(follow_symlinks=False):
+                yield key_prefix + entry.name, entry
+
+
+@functools.lru_cache(maxsize=512)
+def _content_type_for_suffixes(suffixes: str) -> str:
+    """Guess a content type from a file's suffix chain, memoized per chain."""
+    return mimetypes.guess_type("x" + suffixes)[0] or "application/octet-stream"
+
+
+def _guess_content_type(name: str) -> str:
+    """
+    Guess a content type from a file name, as mimetypes.guess_type does.
+    guess_type only looks at the last two suffixes (an encoding such as .gz
+    and the type before it, e.g. .tar.gz), so those form the cache key.
+    """
+    root, ext = os.path.splitext(name)
+    return _content_type_for_suffixes(os.path.splitext(root)[1] + ext)
+
+
+def _http_date(timestamp: float) -> str:
+    """Format a POSIX timestamp as an RFC 9110 HTTP date (locale-independent)."""
+    return format_datetime(datetime.fromtimestamp(timestamp, timezone.utc), usegmt=True)
+
+
+async def iter_file(path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Stream a file in chunks, reading the next chunk while the current one is sent.
+    Overlaps disk reads with socket writes when zero-copy sendfile is unavailable.
+    """
+    async with aiofiles.open(path, "rb") as f:
+        pending = asyncio.ensure_future(f.read(chunk_size))
+        try:
+            # Shielded so cancelling the stream never cancels the read task itself:
+            # a cancelled task reports done while its worker thread is still reading
+            while chunk := await asyncio.shield(pending):
+                pending = asyncio.ensure_future(f.read(chunk_size))
+                yield chunk
+        finally:
+            # Never close the file while a read is still running in the thread pool.
+            # asyncio.wait doesn't cancel what it waits for, so retry if interrupted
+            while not pending.done():
+                try:
+                    await asyncio.wait({pending})
+                except asyncio.CancelledError:
+                    if not pending.done():
+                        continue
+                    raise
+            if not pending.cancelled():
+                pending.exception()  # Consume it; an abandoned read's error is moot
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
@@ -42,6 +445,11 @@ class StorageBackend(ABC):
         """List all buckets."""
         pass
     
+    @abstractmethod
+    async def get_bucket_info(self, bucket: str) -> Optional[dict]:
+        """Get metadata and statistics for a single bucket, or None if it does not exist."""
+        pass
+    
     @abstractmethod
     async def bucket_exists(self, bucket: str) -> bool:
         """Check if bucket exists."""
@@ -63,6 +471,11 @@ class StorageBackend(ABC):
         """Get object path and metadata."""
         pass
     
+    @abstractmethod
+    def open_stream(self, path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+        """Stream the content of an object returned by get_object."""
+        pass
+    
     @abstractmethod
     async def delete_object(self, bucket: str, key: str) -> None:
         """Delete an object."""
@@ -90,19 +503,18 @@ class LocalFilesystemBackend(StorageBackend):
     def __init__(self, base_path: Path):
         self.base_path = base_path
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._root = os.fspath(base_path.resolve())
     
     def _validate_bucket_name(self, bucket: str) -> str:
         """Validate and sanitize bucket name to prevent path traversal."""
-        if not bucket or ".." in bucket or "/" in bucket or "\\" in bucket:
-            raise InvalidPathError(bucket)
-        # Additional validation: alphanumeric, hyphens, underscores only
-        if not bucket.replace("-", "").replace("_", "").isalnum():
+        # Alphanumeric, hyphens, underscores only: rules out '..', '/' and backslashes
+        if not _BUCKET_NAME_RE.match(bucket):
             raise InvalidPathError(bucket)
         return bucket.lower()
     
     def _validate_object_key(self, key: str) -> str:
         """Validate and sanitize object key to prevent path traversal."""
-        if not key or ".." in key:
+        if not key or _UNSAFE_KEY_RE.search(key):
             raise InvalidPathError(key)
         # Normalize path separators
         key = key.replace("\\", "/")
@@ -112,28 +524,29 @@ class LocalFilesystemBackend(StorageBackend):
             raise InvalidPathError("Empty key after normalization")
         return key
     
+    def _bucket_dir(self, bucket: str) -> str:
+        """Get the filesystem path string for a bucket, without touching the filesystem."""
+        bucket = self._validate_bucket_name(bucket)
+        # Ensure the path stays within base_path (defense in depth)
+        if _PATH_TRAVERSAL_PROTECTION:
+            return safe_join(self._root, bucket)
+        return os.path.join(self._root, bucket)
+    
     def _get_bucket_path(self, bucket: str) -> Path:
         """Get the filesystem path for a bucket."""
-        bucket = self._validate_bucket_name(bucket)
-        bucket_path = self.base_path / bucket
-        # Ensure the resolved path is within base_path (defense in depth)
-        if settings.enable_path_traversal_protection:
-            resolved = bucket_path.resolve()
-            if not str(resolved).startswith(str(self.base_path.resolve())):
-                raise InvalidPathError(bucket)
-        return bucket_path
+        return Path(self._bucket_dir(bucket))
     
     def _get_object_path(self, bucket: str, key: str) -> Path:
         """Get the filesystem path for an object."""
-        bucket_path = self._get_bucket_path(bucket)
+        bucket_dir = self._bucket_dir(bucket)
         key = self._validate_object_key(key)
-        object_path = bucket_path / key
-        # Ensure the resolved path is within bucket_path
-        if settings.enable_path_traversal_protection:
-            resolved = object_path.resolve()
-            if not str(resolved).startswith(str(bucket_path.resolve())):
+        # Ensure the path stays within the bucket, also through symbolic links
+        if _PATH_TRAVERSAL_PROTECTION:
+            object_path = safe_join(bucket_dir, key)
+            if has_symlink(self._root, object_path):
                 raise InvalidPathError(key)
-        return object_path
+            return Path(object_path)
+        return Path(bucket_dir, key)
     
     async def create_bucket(self, bucket: str) -> None:
         """Create a new bucket (directory)."""
@@ -155,20 +568,33 @@ class LocalFilesystemBackend(StorageBackend):
     async def list_buckets(self) -> list[dict]:
         """List all buckets."""
         buckets = []
-        for item in self.base_path.iterdir():
-            if item.is_dir():
-                # Calculate bucket stats
-                object_count = sum(1 for _ in item.rglob("*") if _.is_file())
-                total_size = sum(f.stat().st_size for f in item.rglob("*") if f.is_file())
-                created_at = datetime.fromtimestamp(item.stat().st_ctime)
-                buckets.append({
-                    "name": item.name,
-                    "created_at": created_at,
-                    "object_count": object_count,
-                    "total_size": total_size,
-                })
+        with os.scandir(self._root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    buckets.append(self._bucket_info(entry.path, entry.name, entry.stat()))
         return buckets
     
+    async def get_bucket_info(self, bucket: str) -> Optional[dict]:
+        """Get metadata and statistics for a single bucket, or None if it does not exist."""
+        bucket_path = self._get_bucket_path(bucket)
+        try:
+            st = bucket_path.stat()
+        except FileNotFoundError:
+            return None
+        if not stat.S_ISDIR(st.st_mode):
+            return None
+        return self._bucket_info(os.fspath(bucket_path), bucket_path.name, st)
+    
+    def _bucket_info(self, bucket_path: str, name: str, st: os.stat_result) -> dict:
+        """Build the bucket info dict for a bucket directory."""
+        object_count, total_size = _walk_stats(bucket_path)
+        return {
+            "name": name,
+            "created_at": datetime.fromtimestamp(st.st_ctime),
+            "object_count": object_count,
+            "total_size": total_size,
+        }
+    
     async def bucket_exists(self, bucket: str) -> bool:
         """Check if bucket exists. Raises InvalidPathError for invalid paths."""
         bucket_path = self._get_bucket_path(bucket)
@@ -183,7 +609,7 @@ class LocalFilesystemBackend(StorageBackend):
     ) -> ObjectMetadata:
         """
         Upload an object with streaming to avoid loading entire file in memory.
-        Computes MD5 checksum during upload.
+        Computes the ETag checksum during upload.
         """
         if not await self.bucket_exists(bucket):
             raise BucketNotFoundError(bucket)
@@ -198,31 +624,77 @@ class LocalFilesystemBackend(StorageBackend):
             content_type = file.content_type or "application/octet-stream"
             # Try to guess from filename
             if content_type == "application/octet-stream":
-                guessed_type, _ = mimetypes.guess_type(key)
-                if guessed_type:
-                    content_type = guessed_type
-        
-        # Stream file to disk with checksum calculation
-        md5_hash = hashlib.md5()
-        total_size = 0
+                content_type = _guess_content_type(key)
         
-        async with aiofiles.open(object_path, "wb") as f:
-            while chunk := await file.read(settings.chunk_size):
-                # Check file size limit
-                total_size += len(chunk)
-                if total_size > settings.max_file_size:
-                    # Clean up partial file
-                    await f.close()
-                    object_path.unlink(missing_ok=True)
-                    raise FileSizeLimitExceededError(total_size, settings.max_file_size)
-                
-                md5_hash.update(chunk)
-                await f.write(chunk)
+        spooled = file.file
+        if (
+            _FILE_SENDFILE_SUPPORTED
+            and isinstance(spooled, tempfile.SpooledTemporaryFile)
+            and spooled._rolled
+        ):
+            # Upload already spooled to a temp file on disk: copy it in the kernel
+            total_size, etag, crc32 = await asyncio.to_thread(
+                self._sendfile_upload, spooled.fileno(), object_path
+            )
+        else:
+            # Stream file to disk with checksum calculation. Mirror UploadFile.read:
+            # small in-memory spools are read inline, while disk-spooled uploads
+            # are read off-loop into a pooled buffer instead of a new bytes object
+            hasher = _new_hasher()
+            crc32 = 0
+            total_size = 0
+            max_size = settings.max_file_size
+            in_memory = not getattr(spooled, "_rolled", True)
+            buf = None if in_memory else _acquire_buffer()
+            view = None if buf is None else memoryview(buf)
+            
+            try:
+                async with aiofiles.open(object_path, "wb") as f:
+                    _advise_sequential(f.fileno())
+                    while True:
+                        if view is None:
+                            chunk = memoryview(spooled.read(_COPY_BUFFER_SIZE))
+                        else:
+                            chunk = view[:await asyncio.to_thread(spooled.readinto, buf)]
+                        n = len(chunk)
+                        if not n:
+                            break
+                        # Check file size limit
+                        total_size += n
+                        if total_size > max_size:
+                            # Clean up partial file
+                            await f.close()
+                            object_path.unlink(missing_ok=True)
+                            raise FileSizeLimitExceededError(total_size, max_size)
+                        
+                        if n >= _PARALLEL_HASH_MIN:
+                            # hashlib/BLAKE3/zlib release the GIL, so hash while aiofiles writes
+                            _, crc32, _ = await asyncio.gather(
+                                asyncio.to_thread(hasher.update, chunk),
+                                asyncio.to_thread(zlib.crc32, chunk, crc32),
+                                f.write(chunk),
+                            )
+                        else:
+                            hasher.update(chunk)
+                            crc32 = zlib.crc32(chunk, crc32)
+                            await f.write(chunk)
+                        chunk.release()
+                    
+                    if total_size >= _DROP_CACHE_MIN:
+                        await f.flush()
+                        await asyncio.to_thread(_drop_cache, f.fileno(), True)
+            finally:
+                if buf is not None:
+                    view.release()
+                    _release_buffer(buf)
+            
+            etag = hasher.hexdigest()
         
-        etag = md5_hash.hexdigest()
-        
-        # Store metadata as extended attributes or in a separate metadata file
-        # For simplicity, we'll compute it on-demand from filesystem
+        # Cache ETag and content type as extended attributes so metadata
+        # lookups don't need to re-read the file
+        st = object_path.stat()
+        _store_cached_metadata(object_path, st, etag, content_type, crc32)
+        mtime = st.st_mtime
         
         return ObjectMetadata(
             key=key,
@@ -230,120 +702,185 @@ class LocalFilesystemBackend(StorageBackend):
             size=total_size,
             content_type=content_type,
             etag=etag,
-            last_modified=datetime.fromtimestamp(object_path.stat().st_mtime),
+            last_modified=datetime.fromtimestamp(mtime),
+            last_modified_http=_http_date(mtime),
+            checksum_crc32=_encode_crc32(crc32),
             storage_path=str(object_path)
         )
     
-    async def get_object(self, bucket: str, key: str) -> tuple[Path, ObjectMetadata]:
-        """Get object path and metadata for streaming download."""
-        if not await self.bucket_exists(bucket):
-            raise BucketNotFoundError(bucket)
+    def _sendfile_upload(self, src_fd: int, object_path: Path) -> tuple[int, str, int]:
+        """
+        Copy a disk-spooled upload to object_path with sendfile(2), then compute
+        the ETag and CRC32 in a single mapped read of the (now hot) copy.
+        Returns the object size, its ETag and its CRC32.
+        """
+        size = os.fstat(src_fd).st_size
+        if size > settings.max_file_size:
+            raise FileSizeLimitExceededError(size, settings.max_file_size)
         
+        offset = 0
+        dst_fd = os.open(object_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        _advise_sequential(src_fd)
+        _advise_sequential(dst_fd)
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, min(_SENDFILE_CHUNK, size - offset))
+                if not sent:
+                    break
+                offset += sent
+            etag, crc32 = _digest_file(object_path, with_crc32=True)
+        except BaseException:
+            os.close(dst_fd)
+            object_path.unlink(missing_ok=True)
+            raise
+        if offset >= _DROP_CACHE_MIN:
+            _drop_cache(dst_fd, sync=True)
+        os.close(dst_fd)
+        return offset, etag, crc32
+    
+    def _not_found(self, bucket: str, key: str) -> Exception:
+        """Build the error for a missing object, telling a missing bucket apart."""
+        if not os.path.isdir(self._bucket_dir(bucket)):
+            return BucketNotFoundError(bucket)
+        return ObjectNotFoundError(bucket, key)
+    
+    def _stat_object(self, bucket: str, key: str) -> tuple[Path, os.stat_result]:
+        """Resolve and stat an object in one syscall, raising if it is not a regular file."""
         object_path = self._get_object_path(bucket, key)
-        
-        if not object_path.exists() or not object_path.is_file():
+        try:
+            st = os.stat(object_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise self._not_found(bucket, key) from None
+        if not stat.S_ISREG(st.st_mode):
             raise ObjectNotFoundError(bucket, key)
-        
-        metadata = await self.get_object_metadata(bucket, key)
+        return object_path, st
+    
+    async def get_object(self, bucket: str, key: str) -> tuple[Path, ObjectMetadata]:
+        """Get object path and metadata for streaming download."""
+        object_path, st = self._stat_object(bucket, key)
+        metadata = await self._object_metadata(bucket, key, object_path, st)
         return object_path, metadata
     
+    def open_stream(self, path: Path, chunk_size: int) -> AsyncIterator[bytes]:
+        """Stream an object file with prefetched chunked reads."""
+        return iter_file(path, chunk_size)
+    
     async def delete_object(self, bucket: str, key: str) -> None:
         """Delete an object."""
-        if not await self.bucket_exists(bucket):
-            raise BucketNotFoundError(bucket)
-        
         object_path = self._get_object_path(bucket, key)
         
-        if not object_path.exists():
-            raise ObjectNotFoundError(bucket, key)
-        
-        object_path.unlink()
-        
-        # Clean up empty parent directories
         try:
-            parent = object_path.parent
-            while parent != self._get_bucket_path(bucket):
-                if not any(parent.iterdir()):
-                    parent.rmdir()
-                    parent = parent.parent
-                else:
-                    break
-        except OSError:
-            pass  # Directory not empty or other issues
+            os.unlink(object_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise self._not_found(bucket, key) from None
+        except IsADirectoryError:
+            raise ObjectNotFoundError(bucket, key) from None
+        
+        # Clean up empty parent directories up to (never including) the bucket,
+        # like os.removedirs: a single rmdir per level, stopping at the first failure
+        bucket_root = self._bucket_dir(bucket) + os.sep
+        parent = os.path.dirname(object_path)
+        while parent.startswith(bucket_root):
+            try:
+                os.rmdir(parent)
+            except OSError:
+                break  # Directory not empty or other issues
+            parent = os.path.dirname(parent)
     
     async def list_objects(self, bucket: str, prefix: Optional[str] = None) -> list[ObjectMetadata]:
         """List objects in a bucket with optional prefix filter."""
         if not await self.bucket_exists(bucket):
             raise BucketNotFoundError(bucket)
         
-        bucket_path = self._get_bucket_path(bucket)
+        bucket_dir = self._bucket_dir(bucket)
+        candidates = []
         objects = []
         
-        for file_path in bucket_path.rglob("*"):
-            if file_path.is_file():
-                # Get relative path from bucket
-                relative_path = file_path.relative_to(bucket_path)
-                key = str(relative_path).replace(os.sep, "/")
-                
-                # Apply prefix filter
-                if prefix and not key.startswith(prefix):
-                    continue
-                
-                # Compute metadata
-                stat = file_path.stat()
-                content_type, _ = mimetypes.guess_type(str(file_path))
-                content_type = content_type or "application/octet-stream"
-                
-                # Compute ETag (MD5) - for large files, this could be optimized
-                md5_hash = hashlib.md5()
-                async with aiofiles.open(file_path, "rb") as f:
-                    while chunk := await f.read(settings.chunk_size):
-                        md5_hash.update(chunk)
-                etag = md5_hash.hexdigest()
-                
-                objects.append(ObjectMetadata(
-                    key=key,
-                    bucket=bucket,
-                    size=stat.st_size,
-                    content_type=content_type,
-                    etag=etag,
-                    last_modified=datetime.fromtimestamp(stat.st_mtime),
-                ))
+        # Only walk the subtree that can contain matching keys: the directory
+        # part of the prefix, filtered by the remaining name prefix
+        start_dir, name_prefix, key_prefix = bucket_dir, "", ""
+        if prefix:
+            if prefix.startswith("/") or _UNSAFE_KEY_RE.search(prefix):
+                return objects  # No valid key can match
+            subdir, _, name_prefix = prefix.rpartition("/")
+            if subdir:
+                # Listed keys are canonical: no '.' or empty path segments
+                if any(segment in ("", ".") for segment in subdir.split("/")):
+                    return objects
+                start_dir = os.path.join(bucket_dir, subdir)
+                if not os.path.isdir(start_dir):
+                    return objects
+                key_prefix = subdir + "/"
+        
+        # The walk never follows symbolic links, so a linked start directory lists nothing
+        if _PATH_TRAVERSAL_PROTECTION and has_symlink(self._root, start_dir):
+            return objects
+        
+        for key, entry in _walk_files(start_dir, name_prefix, key_prefix):
+            # Apply prefix filter
+            if prefix and not key.startswith(prefix):
+                continue
+            
+            # Compute metadata; DirEntry caches the stat result
+            file_path = entry.path
+            st = entry.stat(follow_symlinks=False)
+            content_type = _load_cached_content_type(file_path)
+            if content_type is None:
+                content_type = _guess_content_type(entry.name)
+            
+            candidates.append((key, file_path, st, content_type, _load_cached_etag(file_path, st)))
+        
+        # Only cache misses need a task: hash them concurrently on the bounded pool
+        misses = [i for i, candidate in enumerate(candidates) if candidate[4] is None]
+        if misses:
+            hashed = await asyncio.gather(
+                *(_compute_etag(candidates[i][1], candidates[i][2]) for i in misses)
+            )
+            for i, etag in zip(misses, hashed):
+                candidates[i] = candidates[i][:4] + (etag,)
+        
+        # Every field comes from the filesystem, so skip pydantic validation per row
+        build = ObjectMetadata.model_construct
+        for key, _, st, content_type, etag in candidates:
+            objects.append(build(
+                key=key,
+                bucket=bucket,
+                size=st.st_size,
+                content_type=content_type,
+                etag=etag,
+                last_modified=datetime.fromtimestamp(st.st_mtime),
+            ))
         
         return objects
     
     async def get_object_metadata(self, bucket: str, key: str) -> ObjectMetadata:
         """Get object metadata without downloading the file."""
-        if not await self.bucket_exists(bucket):
-            raise BucketNotFoundError(bucket)
-        
-        object_path = self._get_object_path(bucket, key)
-        
-        if not object_path.exists() or not object_path.is_file():
-            raise ObjectNotFoundError(bucket, key)
-        
-        stat = object_path.stat()
-        content_type, _ = mimetypes.guess_type(str(object_path))
-        content_type = content_type or "application/octet-stream"
+        object_path, st = self._stat_object(bucket, key)
+        return await self._object_metadata(bucket, key, object_path, st)
+    
+    async def _object_metadata(
+        self, bucket: str, key: str, object_path: Path, st: os.stat_result
+    ) -> ObjectMetadata:
+        """Build the metadata of a stat'ed object from its cached xattrs."""
+        content_type = _load_cached_content_type(object_path)
+        if content_type is None:
+            content_type = _guess_content_type(object_path.name)
         
-        # Compute ETag (MD5 checksum)
-        md5_hash = hashlib.md5()
-        async with aiofiles.open(object_path, "rb") as f:
-            while chunk := await f.read(settings.chunk_size):
-                md5_hash.update(chunk)
-        etag = md5_hash.hexdigest()
+        etag = await _get_etag(object_path, st)
         
         return ObjectMetadata(
             key=key,
             bucket=bucket,
-            size=stat.st_size,
+            size=st.st_size,
             content_type=content_type,
             etag=etag,
-            last_modified=datetime.fromtimestamp(stat.st_mtime),
+            last_modified=datetime.fromtimestamp(st.st_mtime),
+            last_modified_http=_http_date(st.st_mtime),
+            checksum_crc32=_load_cached_checksum(object_path, st),
             storage_path=str(object_path)
         )
 
 
 # Global storage instance
-storage_backend: StorageBackend = LocalFilesystemBackend(settings.get_storage_path())
+storage_backend: StorageBackend = LocalFilesystemBackend(settings.storage_path)
 
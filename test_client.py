@@ -6,6 +6,7 @@ Demonstrates how to interact with the API programmatically.
 import io
 import requests
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 
 class ObjectStorageClient:
@@ -14,16 +15,21 @@ class ObjectStorageClient:
     def __init__(self, base_url: str = "http://localhost:8001"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api/v1"
+        # Reuse pooled keep-alive connections instead of reconnecting per call
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def health_check(self):
         """Check API health."""
-        response = requests.get(f"{self.base_url}/health")
+        response = self.session.get(f"{self.base_url}/health")
         response.raise_for_status()
         return response.json()
     
     def create_bucket(self, name: str):
         """Create a new bucket."""
-        response = requests.post(
+        response = self.session.post(
             f"{self.api_base}/buckets/",
             json={"name": name}
         )
@@ -32,19 +38,19 @@ class ObjectStorageClient:
     
     def list_buckets(self):
         """List all buckets."""
-        response = requests.get(f"{self.api_base}/buckets/")
+        response = self.session.get(f"{self.api_base}/buckets/")
         response.raise_for_status()
         return response.json()
     
     def get_bucket(self, name: str):
         """Get bucket information."""
-        response = requests.get(f"{self.api_base}/buckets/{name}")
+        response = self.session.get(f"{self.api_base}/buckets/{name}")
         response.raise_for_status()
         return response.json()
     
     def delete_bucket(self, name: str):
         """Delete a bucket."""
-        response = requests.delete(f"{self.api_base}/buckets/{name}")
+        response = self.session.delete(f"{self.api_base}/buckets/{name}")
         response.raise_for_status()
         return response.status_code == 204
     
@@ -55,7 +61,7 @@ class ObjectStorageClient:
         if content_type:
             data["content_type"] = content_type
         
-        response = requests.post(
+        response = self.session.post(
             f"{self.api_base}/objects/{bucket}",
             files=files,
             data=data
@@ -66,19 +72,23 @@ class ObjectStorageClient:
     def list_objects(self, bucket: str, prefix: str = None):
         """List objects in a bucket."""
         params = {"prefix": prefix} if prefix else {}
-        response = requests.get(f"{self.api_base}/objects/{bucket}", params=params)
+        response = self.session.get(f"{self.api_base}/objects/{bucket}", params=params)
         response.raise_for_status()
         return response.json()
     
+    def stream_object(self, bucket: str, key: str, chunk_size: int = 64 * 1024):
+        """Download an object as a stream of chunks, without buffering it in memory."""
+        with self.session.get(f"{self.api_base}/objects/{bucket}/{key}", stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+    
     def download_object(self, bucket: str, key: str):
         """Download an object."""
-        response = requests.get(f"{self.api_base}/objects/{bucket}/{key}")
-        response.raise_for_status()
-        return response.content
+        return b"".join(self.stream_object(bucket, key))
     
     def get_object_metadata(self, bucket: str, key: str):
         """Get object metadata."""
-        response = requests.head(f"{self.api_base}/objects/{bucket}/{key}")
+        response = self.session.head(f"{self.api_base}/objects/{bucket}/{key}")
         response.raise_for_status()
         return {
             "content_type": response.headers.get("Content-Type"),
@@ -89,7 +99,7 @@ class ObjectStorageClient:
     
     def delete_object(self, bucket: str, key: str):
         """Delete an object."""
-        response = requests.delete(f"{self.api_base}/objects/{bucket}/{key}")
+        response = self.session.delete(f"{self.api_base}/objects/{bucket}/{key}")
         response.raise_for_status()
         return response.status_code == 204
 
@@ -4,13 +4,15 @@ Quick test script to verify the object storage system functionality.
 """
 import asyncio
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from app.config import settings
 from app.storage import storage_backend
-from app.exceptions import BucketAlreadyExistsError, BucketNotFoundError
+from app.exceptions import BucketAlreadyExistsError, BucketNotFoundError, InvalidPathError
 
 
 async def run_tests():
@@ -58,6 +60,26 @@ async def run_tests():
     except Exception as e:
         print(f"   ✅ Path traversal blocked correctly")
     
+    # Test 7: Symbolic links must not escape the storage root
+    print("\n7️⃣  Testing symlink escape protection...")
+    with tempfile.TemporaryDirectory() as outside:
+        target = Path(outside, "secret.txt")
+        target.write_text("outside the storage root")
+        link = settings.storage_path / "test-bucket" / "escape-link"
+        link.unlink(missing_ok=True)
+        link.symlink_to(target)
+        try:
+            await storage_backend.get_object_metadata("test-bucket", "escape-link")
+            print("   ❌ SECURITY ISSUE: Symlink escape not blocked!")
+        except InvalidPathError:
+            listed = [obj.key for obj in await storage_backend.list_objects("test-bucket")]
+            if "escape-link" in listed:
+                print("   ❌ Symlink blocked for reads but still listed")
+            else:
+                print("   ✅ Symlink escape blocked correctly")
+        finally:
+            link.unlink()
+    
     print("\n" + "="*50)
     print("✅ All tests completed successfully!")
     print("="*50)